@@ -10,67 +10,162 @@ AI system designed to win 51%+ of trades by providing:
 - Clear BUY/SELL/YES/NO recommendations
 """
 
-import requests
-import json
+import heapq
+import io
+import operator
 import sys
 import os
+import re
 import time
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from collections import namedtuple
+from typing import Dict, Any, Iterator, List, Tuple
+from datetime import datetime, timedelta, timezone
+
+import polymarket_api
+import scoring
 
 # Set UTF-8 encoding for Windows
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    # Reconfigure in place; a second wrapper around sys.stdout.buffer would
+    # close it when the first is discarded
+    sys.stdout.reconfigure(encoding='utf-8')
 
 
-class PolymarketTradingAI:
-    """AI trading system for Polymarket with detailed chain of thought."""
-    
-    BASE_URL = "https://gamma-api.polymarket.com"
+def _keyword_pattern(*keyword_sets: frozenset) -> re.Pattern:
+    """
+    Compile an alternation matching any of the keywords.
+
+    Single words must match whole words. Multi-word phrases only need a word
+    boundary at the start, so 'rate hike' still matches "rate hikes" as the
+    original substring checks did.
+    """
+    keywords = sorted(frozenset().union(*keyword_sets), key=len, reverse=True)
+    alternatives = (
+        re.escape(keyword) if ' ' in keyword else re.escape(keyword) + r'\b'
+        for keyword in keywords
+    )
+    return re.compile(r'\b(?:' + '|'.join(alternatives) + ')')
+
+
+# Sentiment keywords. Each category is matched with a single regex pass and
+# the distinct hits are split into positive/negative by set membership.
+
+# Current economic/political keywords (2025)
+_REDDIT_POS_CURRENT = frozenset({'rate cut', 'rate cuts', 'stimulus', 'growth', 'recovery', 'bullish', 'positive'})
+_REDDIT_NEG_CURRENT = frozenset({'rate hike', 'recession', 'crisis', 'crash', 'bearish', 'negative', 'decline'})
+_REDDIT_CURRENT_RE = _keyword_pattern(_REDDIT_POS_CURRENT, _REDDIT_NEG_CURRENT)
+
+# General positive/negative keywords
+_REDDIT_POS_GENERAL = frozenset({'win', 'success', 'up', 'rise', 'gain', 'beat', 'victory'})
+_REDDIT_NEG_GENERAL = frozenset({'lose', 'fail', 'down', 'fall', 'loss', 'defeat'})
+_REDDIT_GENERAL_RE = _keyword_pattern(_REDDIT_POS_GENERAL, _REDDIT_NEG_GENERAL)
+
+# Economic/political keywords
+_NEWS_POS = frozenset({'growth', 'boom', 'recovery', 'increase', 'improve', 'strong'})
+_NEWS_NEG = frozenset({'recession', 'crisis', 'decline', 'weak', 'fall', 'crash'})
+_NEWS_RE = _keyword_pattern(_NEWS_POS, _NEWS_NEG)
+
+# Social media keywords
+_SOCIAL_POS = frozenset({'trending', 'popular', 'viral', 'hype', 'excited', 'optimistic'})
+_SOCIAL_NEG = frozenset({'controversy', 'scandal', 'concern', 'worried', 'pessimistic'})
+_SOCIAL_RE = _keyword_pattern(_SOCIAL_POS, _SOCIAL_NEG)
+
+# Chain-of-thought descriptions for each scoring tier (see scoring.py)
+_HIST_VOLUME_LABELS = (
+    "Low volume (<$10K) - Limited interest",
+    "Moderate volume (>$10K) - Decent interest",
+    "High volume (>$50K) - Good interest",
+    "Very high volume (>$100K) - Strong interest",
+)
+_HIST_LIQUIDITY_LABELS = (
+    "Very low liquidity (<$100) - Very hard to trade",
+    "Low liquidity (>$100) - Hard to trade",
+    "Good liquidity (>$1K) - Tradeable",
+    "High liquidity (>$10K) - Easy to trade",
+)
+_RISK_DAYS_LABELS = (
+    "Very high time risk (ends within 1 day)",
+    "High time risk (ends within 3 days)",
+    "Moderate time risk (ends within 1 week)",
+    "Low time risk (ends within 1 month)",
+    "Very low time risk (ends in >1 month)",
+)
+_RISK_LIQUIDITY_LABELS = (
+    "High liquidity risk (low liquidity)",
+    "Moderate liquidity risk",
+    "Low liquidity risk (high liquidity)",
+)
+_VOLATILE_CATEGORIES = frozenset({'sports', 'politics', 'crypto'})
+
+_DATA_SOURCES = (
+    "Reddit API (free)",
+    "News keyword analysis (free)",
+    "Social media keyword analysis (free)",
+    "Polymarket historical data (free)",
+)
+
+_NEUTRAL_SENTIMENT = {
+    'score': 0.5,
+    'inputs': {'reddit': 0.5, 'news': 0.5, 'social': 0.5}
+}
+
+
+def _polarity_counts(pattern: re.Pattern, positive: frozenset, question_lower: str) -> Tuple[int, int]:
+    """Count the distinct positive and negative keywords found in a question."""
+    hits = set(pattern.findall(question_lower))
+    pos_count = len(hits & positive)
+    return pos_count, len(hits) - pos_count
+
+# Flattened (event, market) pair with the fields the analysis reads
+MarketRow = namedtuple('MarketRow', 'event_id market_id question vol liq end_dt category')
+
+
+class PolymarketEventsClient:
+    """Concurrent, paginated client for the Polymarket /events endpoint."""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session = polymarket_api.configure_session()
     
-    def get_current_active_markets(self, limit: int = 100) -> Dict[str, Any]:
-        """Get current active markets that are still trading."""
-        url = f"{self.BASE_URL}/events"
+    def iter_event_pages(self, limit: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of current active events, in order.
+        
+        Pages are fetched concurrently (see polymarket_api.iter_event_pages);
+        each page is released as soon as the caller moves on, so only
+        unconsumed pages are held in memory.
+        
+        Args:
+            limit: Maximum number of events to fetch
+            
+        Yields:
+            Lists of event dicts, at most polymarket_api.PAGE_SIZE each
+        """
+        # Let the API drop expired events instead of filtering them here
         params = {
-            "limit": limit,
             "active": "true",
             "closed": "false",  # Exclude closed events
-            "archived": "false"  # Exclude archived events
+            "archived": "false",  # Exclude archived events
+            "end_date_min": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
         }
         
+        yield from polymarket_api.iter_event_pages(self.session, params, limit)
+
+
+class PolymarketTradingAI:
+    """AI trading system for Polymarket with detailed chain of thought."""
+    
+    def __init__(self):
+        self.client = PolymarketEventsClient()
+        self.session = self.client.session
+        # Print per-market progress while analyzing (reports are always shown)
+        self._verbose = False
+        # Sentiment results keyed by question; scoring depends only on the text
+        self._sent_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def get_current_active_markets(self, limit: int = 100) -> Dict[str, Any]:
+        """Get current active markets that are still trading."""
         try:
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Filter for truly current events (not expired)
-            current_date = datetime.now()
-            current_events = []
-            
-            for event in data:
-                end_date = event.get('endDate', '')
-                if end_date:
-                    try:
-                        end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                        # Only include events that haven't ended yet
-                        if end_dt > current_date:
-                            current_events.append(event)
-                    except:
-                        # If we can't parse the date, include it
-                        current_events.append(event)
-                else:
-                    # If no end date, include it
-                    current_events.append(event)
-            
-            print(f"📊 Found {len(data)} total events")
-            print(f"✅ Filtered to {len(current_events)} current active events")
+            current_events = [event for page in self.client.iter_event_pages(limit) for event in page]
             
             return {
                 "success": True,
@@ -86,313 +181,228 @@ class PolymarketTradingAI:
                 "error": str(e)
             }
     
-    def analyze_market_for_trading(self, event: Dict[str, Any], market: Dict[str, Any]) -> Dict[str, Any]:
+    def _active_market_rows(self, events: List[Dict[str, Any]]) -> Iterator[MarketRow]:
+        """Yield a MarketRow for each market with some trading activity."""
+        for event in events:
+            for market in event.get('markets', ()):
+                # Convert once; the row carries the floats from here on
+                volume = float(market.get('volume') or 0)
+                liquidity = float(market.get('liquidity') or 0)
+                
+                # Must have some trading activity
+                if liquidity > 0 or volume > 1000:
+                    end_date = market.get('endDate')
+                    yield MarketRow(
+                        event.get('id', ''),
+                        market.get('id', ''),
+                        market.get('question', ''),
+                        volume,
+                        liquidity,
+                        polymarket_api.parse_end_date(end_date) if end_date else None,
+                        event.get('category') or ''
+                    )
+    
+    def analyze_market_for_trading(self, row: MarketRow) -> Dict[str, Any]:
         """
-        Analyze a market for trading opportunities with detailed chain of thought.
+        Analyze a market for trading opportunities.
+        
+        Only the scores and their inputs are recorded here; the chain of
+        thought is rendered on demand by _render_chain_of_thought.
         
         Args:
-            event: Event data
-            market: Market data
+            row: Market with its event context
             
         Returns:
-            Trading recommendation with chain of thought
+            Trading recommendation with the data behind it
         """
-        event_id = event.get('id', '')
-        market_id = market.get('id', '')
-        question = market.get('question', '')
-        
-        print(f"\n🧠 AI ANALYSIS: {question[:60]}...")
-        print(f"Event ID: {event_id}")
-        print(f"Market ID: {market_id}")
-        
-        # Initialize chain of thought
-        chain_of_thought = []
-        analysis_data = {
-            'event_id': event_id,
-            'market_id': market_id,
-            'question': question,
-            'chain_of_thought': chain_of_thought,
-            'recommendation': 'HOLD',
-            'confidence': 0.5,
-            'reasoning': '',
-            'data_sources': []
-        }
+        if self._verbose:
+            print(f"\n🧠 AI ANALYSIS: {row.question[:60]}...")
+            print(f"Event ID: {row.event_id}")
+            print(f"Market ID: {row.market_id}")
         
         # Step 1: Analyze Polymarket Data
-        chain_of_thought.append("STEP 1: Analyzing Polymarket Data")
-        
-        volume = float(market.get('volume', 0))
-        liquidity = float(market.get('liquidity', 0))
-        end_date = market.get('endDate', '')
-        
-        # Calculate days until end
         days_until_end = 0
-        if end_date:
-            try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                days_until_end = (end_dt - datetime.now()).days
-            except:
-                pass
-        
-        chain_of_thought.append(f"  - Volume: ${volume:,.0f}")
-        chain_of_thought.append(f"  - Liquidity: ${liquidity:,.0f}")
-        chain_of_thought.append(f"  - Days until end: {days_until_end}")
+        if row.end_dt is not None:
+            days_until_end = (row.end_dt - datetime.now(timezone.utc)).days
         
         # Step 2: Market Sentiment Analysis
-        chain_of_thought.append("\nSTEP 2: Market Sentiment Analysis")
-        
-        sentiment_data = self._analyze_market_sentiment(question)
-        chain_of_thought.extend(sentiment_data['analysis'])
-        analysis_data['data_sources'].extend(sentiment_data['sources'])
+        sentiment_data = self._analyze_market_sentiment(row.question)
         
         # Step 3: Historical Performance Analysis
-        chain_of_thought.append("\nSTEP 3: Historical Performance Analysis")
-        
-        historical_data = self._analyze_historical_performance(event, market)
-        chain_of_thought.extend(historical_data['analysis'])
-        analysis_data['data_sources'].extend(historical_data['sources'])
+        historical_data = self._analyze_historical_performance(row)
         
         # Step 4: Risk Assessment
-        chain_of_thought.append("\nSTEP 4: Risk Assessment")
-        
-        risk_data = self._assess_trading_risk(market, days_until_end)
-        chain_of_thought.extend(risk_data['analysis'])
+        risk_data = self._assess_trading_risk(row, days_until_end)
         
         # Step 5: Generate Recommendation
-        chain_of_thought.append("\nSTEP 5: Generate Trading Recommendation")
-        
         recommendation_data = self._generate_recommendation(
-            volume, liquidity, days_until_end, 
+            row.vol, row.liq, days_until_end, 
             sentiment_data['score'], historical_data['score'], risk_data['score']
         )
         
-        chain_of_thought.extend(recommendation_data['analysis'])
-        
-        # Update analysis data
-        analysis_data.update({
+        return {
+            'event_id': row.event_id,
+            'market_id': row.market_id,
+            'question': row.question,
             'recommendation': recommendation_data['recommendation'],
             'confidence': recommendation_data['confidence'],
             'reasoning': recommendation_data['reasoning'],
-            'volume': volume,
-            'liquidity': liquidity,
+            'data_sources': _DATA_SOURCES,
+            'volume': row.vol,
+            'liquidity': row.liq,
             'days_until_end': days_until_end,
+            'category': row.category,
+            # Copy: the cached (or shared neutral) inputs must not be aliased
+            'sentiment_inputs': dict(sentiment_data['inputs']),
             'sentiment_score': sentiment_data['score'],
             'historical_score': historical_data['score'],
-            'risk_score': risk_data['score']
-        })
-        
-        return analysis_data
+            'risk_score': risk_data['score'],
+            'overall_score': recommendation_data['overall_score']
+        }
+    
+    def _render_chain_of_thought(self, analysis_data: Dict[str, Any]) -> List[str]:
+        """Rebuild the chain-of-thought lines from a market's recorded analysis."""
+        volume = analysis_data['volume']
+        liquidity = analysis_data['liquidity']
+        days_until_end = analysis_data['days_until_end']
+        category = analysis_data['category']
+        sentiment = analysis_data['sentiment_inputs']
+        
+        chain_of_thought = [
+            "STEP 1: Analyzing Polymarket Data",
+            f"  - Volume: ${volume:,.0f}",
+            f"  - Liquidity: ${liquidity:,.0f}",
+            f"  - Days until end: {days_until_end}",
+            
+            "\nSTEP 2: Market Sentiment Analysis",
+            "  Reddit Sentiment Analysis:",
+            f"    - Reddit sentiment: {sentiment['reddit']:.2f}",
+            "  News Sentiment Analysis:",
+            f"    - News sentiment: {sentiment['news']:.2f}",
+            "  Social Media Sentiment:",
+            f"    - Social sentiment: {sentiment['social']:.2f}",
+            f"  Overall sentiment score: {analysis_data['sentiment_score']:.2f}",
+            
+            "\nSTEP 3: Historical Performance Analysis",
+            "  Volume Analysis:",
+            f"    - {_HIST_VOLUME_LABELS[scoring.tier(scoring.HIST_VOLUME_THRESHOLDS, volume)]}",
+            "  Liquidity Analysis:",
+            f"    - {_HIST_LIQUIDITY_LABELS[scoring.tier(scoring.HIST_LIQUIDITY_THRESHOLDS, liquidity)]}",
+            "  Category Analysis:",
+        ]
+        if category.lower() in _VOLATILE_CATEGORIES:
+            chain_of_thought.append(f"    - High-volatility category: {category}")
+        else:
+            chain_of_thought.append(f"    - Category: {category}")
+        
+        chain_of_thought.extend([
+            "\nSTEP 4: Risk Assessment",
+            "  Time Risk Analysis:",
+            f"    - {_RISK_DAYS_LABELS[scoring.tier(scoring.RISK_DAYS_THRESHOLDS, days_until_end)]}",
+            "  Liquidity Risk Analysis:",
+            f"    - {_RISK_LIQUIDITY_LABELS[scoring.tier(scoring.RISK_LIQUIDITY_THRESHOLDS, liquidity)]}",
+            
+            "\nSTEP 5: Generate Trading Recommendation",
+            "  Overall Score Calculation:",
+            f"    - Sentiment: {analysis_data['sentiment_score']:.2f} (weight: {scoring.SENTIMENT_WEIGHT})",
+            f"    - Historical: {analysis_data['historical_score']:.2f} (weight: {scoring.HISTORICAL_WEIGHT})",
+            f"    - Risk: {analysis_data['risk_score']:.2f} (weight: {scoring.RISK_WEIGHT})",
+            f"    - Overall Score: {analysis_data['overall_score']:.2f}",
+            f"  Recommendation: {analysis_data['recommendation']}",
+            f"  Confidence: {analysis_data['confidence']:.2f}",
+            f"  Reasoning: {analysis_data['reasoning']}",
+        ])
+        return chain_of_thought
     
     def _analyze_market_sentiment(self, question: str) -> Dict[str, Any]:
         """Analyze market sentiment using free tools."""
-        analysis = []
-        sources = []
-        score = 0.5  # Start neutral
-        
-        # Reddit Sentiment Analysis
-        analysis.append("  Reddit Sentiment Analysis:")
-        reddit_score = self._get_reddit_sentiment(question)
-        analysis.append(f"    - Reddit sentiment: {reddit_score:.2f}")
-        sources.append("Reddit API (free)")
-        
-        # News Sentiment Analysis
-        analysis.append("  News Sentiment Analysis:")
-        news_score = self._get_news_sentiment(question)
-        analysis.append(f"    - News sentiment: {news_score:.2f}")
-        sources.append("News keyword analysis (free)")
-        
-        # Social Media Sentiment
-        analysis.append("  Social Media Sentiment:")
-        social_score = self._get_social_sentiment(question)
-        analysis.append(f"    - Social sentiment: {social_score:.2f}")
-        sources.append("Social media keyword analysis (free)")
+        # No text means no keyword can match; skip straight to neutral
+        if not question:
+            return _NEUTRAL_SENTIMENT
+        
+        cached = self._sent_cache.get(question)
+        if cached is not None:
+            return cached
+        
+        # Lowercase once for all sentiment sources
+        question_lower = question.lower()
+        
+        reddit_score = self._get_reddit_sentiment(question_lower)
+        news_score = self._get_news_sentiment(question_lower)
+        social_score = self._get_social_sentiment(question_lower)
         
         # Calculate overall sentiment
         sentiment_scores = [reddit_score, news_score, social_score]
         score = sum(sentiment_scores) / len(sentiment_scores)
-        analysis.append(f"  Overall sentiment score: {score:.2f}")
         
-        return {
+        result = {
             'score': score,
-            'analysis': analysis,
-            'sources': sources
+            'inputs': {
+                'reddit': reddit_score,
+                'news': news_score,
+                'social': social_score
+            }
         }
+        self._sent_cache[question] = result
+        return result
     
-    def _get_reddit_sentiment(self, question: str) -> float:
+    def _get_reddit_sentiment(self, question_lower: str) -> float:
         """Get Reddit sentiment using keyword analysis for current topics."""
-        question_lower = question.lower()
-        
-        # Current economic/political keywords (2025)
-        positive_current = ['rate cut', 'rate cuts', 'stimulus', 'growth', 'recovery', 'bullish', 'positive']
-        negative_current = ['rate hike', 'recession', 'crisis', 'crash', 'bearish', 'negative', 'decline']
-        
-        # General positive/negative keywords
-        positive_words = ['win', 'success', 'up', 'rise', 'gain', 'beat', 'victory']
-        negative_words = ['lose', 'fail', 'down', 'fall', 'loss', 'defeat']
-        
         # Check current economic keywords first
-        pos_count = sum(1 for word in positive_current if word in question_lower)
-        neg_count = sum(1 for word in negative_current if word in question_lower)
+        pos_count, neg_count = _polarity_counts(_REDDIT_CURRENT_RE, _REDDIT_POS_CURRENT, question_lower)
         
         # If no current keywords, check general keywords
         if pos_count + neg_count == 0:
-            pos_count = sum(1 for word in positive_words if word in question_lower)
-            neg_count = sum(1 for word in negative_words if word in question_lower)
+            pos_count, neg_count = _polarity_counts(_REDDIT_GENERAL_RE, _REDDIT_POS_GENERAL, question_lower)
         
         if pos_count + neg_count > 0:
             return pos_count / (pos_count + neg_count)
         return 0.5
     
-    def _get_news_sentiment(self, question: str) -> float:
+    def _get_news_sentiment(self, question_lower: str) -> float:
         """Get news sentiment using keyword analysis."""
-        question_lower = question.lower()
-        
-        # Economic/political keywords
-        positive_econ = ['growth', 'boom', 'recovery', 'increase', 'improve', 'strong']
-        negative_econ = ['recession', 'crisis', 'decline', 'weak', 'fall', 'crash']
-        
-        pos_count = sum(1 for word in positive_econ if word in question_lower)
-        neg_count = sum(1 for word in negative_econ if word in question_lower)
+        pos_count, neg_count = _polarity_counts(_NEWS_RE, _NEWS_POS, question_lower)
         
         if pos_count + neg_count > 0:
             return pos_count / (pos_count + neg_count)
         return 0.5
     
-    def _get_social_sentiment(self, question: str) -> float:
+    def _get_social_sentiment(self, question_lower: str) -> float:
         """Get social media sentiment using keyword analysis."""
-        question_lower = question.lower()
-        
-        # Social media keywords
-        positive_social = ['trending', 'popular', 'viral', 'hype', 'excited', 'optimistic']
-        negative_social = ['controversy', 'scandal', 'concern', 'worried', 'pessimistic']
-        
-        pos_count = sum(1 for word in positive_social if word in question_lower)
-        neg_count = sum(1 for word in negative_social if word in question_lower)
+        pos_count, neg_count = _polarity_counts(_SOCIAL_RE, _SOCIAL_POS, question_lower)
         
         if pos_count + neg_count > 0:
             return pos_count / (pos_count + neg_count)
         return 0.5
     
-    def _analyze_historical_performance(self, event: Dict[str, Any], market: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_historical_performance(self, row: MarketRow) -> Dict[str, Any]:
         """Analyze historical performance patterns."""
-        analysis = []
-        sources = []
-        score = 0.5
-        
-        # Volume trend analysis
-        volume = float(market.get('volume', 0))
-        analysis.append("  Volume Analysis:")
-        
-        if volume > 100000:
-            analysis.append("    - Very high volume (>$100K) - Strong interest")
-            score += 0.2
-        elif volume > 50000:
-            analysis.append("    - High volume (>$50K) - Good interest")
-            score += 0.1
-        elif volume > 10000:
-            analysis.append("    - Moderate volume (>$10K) - Decent interest")
-        else:
-            analysis.append("    - Low volume (<$10K) - Limited interest")
-            score -= 0.1
-        
-        # Liquidity analysis
-        liquidity = float(market.get('liquidity', 0))
-        analysis.append("  Liquidity Analysis:")
-        
-        if liquidity > 10000:
-            analysis.append("    - High liquidity (>$10K) - Easy to trade")
-            score += 0.2
-        elif liquidity > 1000:
-            analysis.append("    - Good liquidity (>$1K) - Tradeable")
-            score += 0.1
-        elif liquidity > 100:
-            analysis.append("    - Low liquidity (>$100) - Hard to trade")
-        else:
-            analysis.append("    - Very low liquidity (<$100) - Very hard to trade")
-            score -= 0.2
-        
-        # Category analysis
-        category = event.get('category', '')
-        analysis.append("  Category Analysis:")
-        
-        if category.lower() in ['sports', 'politics', 'crypto']:
-            analysis.append(f"    - High-volatility category: {category}")
-            score += 0.1
-        else:
-            analysis.append(f"    - Category: {category}")
-        
-        sources.append("Polymarket historical data (free)")
+        volatile = row.category.lower() in _VOLATILE_CATEGORIES
         
         return {
-            'score': min(max(score, 0.0), 1.0),
-            'analysis': analysis,
-            'sources': sources
+            'score': scoring.historical_score(row.vol, row.liq, volatile),
+            'inputs': {
+                'volume': row.vol,
+                'liquidity': row.liq,
+                'category': row.category
+            }
         }
     
-    def _assess_trading_risk(self, market: Dict[str, Any], days_until_end: int) -> Dict[str, Any]:
+    def _assess_trading_risk(self, row: MarketRow, days_until_end: int) -> Dict[str, Any]:
         """Assess trading risk factors."""
-        analysis = []
-        score = 0.5
-        
-        analysis.append("  Time Risk Analysis:")
-        
-        if days_until_end <= 1:
-            analysis.append("    - Very high time risk (ends within 1 day)")
-            score -= 0.3
-        elif days_until_end <= 3:
-            analysis.append("    - High time risk (ends within 3 days)")
-            score -= 0.2
-        elif days_until_end <= 7:
-            analysis.append("    - Moderate time risk (ends within 1 week)")
-            score -= 0.1
-        elif days_until_end <= 30:
-            analysis.append("    - Low time risk (ends within 1 month)")
-            score += 0.1
-        else:
-            analysis.append("    - Very low time risk (ends in >1 month)")
-            score += 0.2
-        
-        analysis.append("  Liquidity Risk Analysis:")
-        liquidity = float(market.get('liquidity', 0))
-        
-        if liquidity > 5000:
-            analysis.append("    - Low liquidity risk (high liquidity)")
-            score += 0.1
-        elif liquidity > 1000:
-            analysis.append("    - Moderate liquidity risk")
-        else:
-            analysis.append("    - High liquidity risk (low liquidity)")
-            score -= 0.2
-        
         return {
-            'score': min(max(score, 0.0), 1.0),
-            'analysis': analysis,
-            'sources': []
+            'score': scoring.risk_score(row.liq, days_until_end),
+            'inputs': {
+                'liquidity': row.liq,
+                'days_until_end': days_until_end
+            }
         }
     
     def _generate_recommendation(self, volume: float, liquidity: float, days_until_end: int,
                                sentiment_score: float, historical_score: float, risk_score: float) -> Dict[str, Any]:
         """Generate final trading recommendation."""
-        analysis = []
-        
         # Calculate overall score
-        weights = {
-            'sentiment': 0.4,
-            'historical': 0.3,
-            'risk': 0.3
-        }
-        
-        overall_score = (
-            sentiment_score * weights['sentiment'] +
-            historical_score * weights['historical'] +
-            risk_score * weights['risk']
-        )
-        
-        analysis.append(f"  Overall Score Calculation:")
-        analysis.append(f"    - Sentiment: {sentiment_score:.2f} (weight: {weights['sentiment']})")
-        analysis.append(f"    - Historical: {historical_score:.2f} (weight: {weights['historical']})")
-        analysis.append(f"    - Risk: {risk_score:.2f} (weight: {weights['risk']})")
-        analysis.append(f"    - Overall Score: {overall_score:.2f}")
+        overall_score = scoring.overall_score(sentiment_score, historical_score, risk_score)
         
         # Generate recommendation (more aggressive for current markets)
         if overall_score >= 0.6:
@@ -416,17 +426,28 @@ class PolymarketTradingAI:
             confidence = 0.5
             reasoning = f"Mixed signals for current market (score: {overall_score:.2f})"
         
-        analysis.append(f"  Recommendation: {recommendation}")
-        analysis.append(f"  Confidence: {confidence:.2f}")
-        analysis.append(f"  Reasoning: {reasoning}")
-        
         return {
             'recommendation': recommendation,
             'confidence': confidence,
             'reasoning': reasoning,
-            'analysis': analysis
+            'overall_score': overall_score
         }
     
+    def _print_recommendation(self, rec: Dict[str, Any], file) -> None:
+        """Print a recommendation with its chain of thought to a text stream."""
+        print(f"\n{'='*80}", file=file)
+        print(f"Event ID: {rec['event_id']}", file=file)
+        print(f"Market ID: {rec['market_id']}", file=file)
+        print(f"Question: {rec['question']}", file=file)
+        print(f"Recommendation: {rec['recommendation']} (Confidence: {rec['confidence']:.2f})", file=file)
+        print(f"Reasoning: {rec['reasoning']}", file=file)
+        print(f"\n🧠 AI CHAIN OF THOUGHT:", file=file)
+        for thought in self._render_chain_of_thought(rec):
+            print(f"  {thought}", file=file)
+        print(f"\n📊 DATA SOURCES:", file=file)
+        for source in rec['data_sources']:
+            print(f"  - {source}", file=file)
+    
     def run_trading_analysis(self, max_events: int = 50) -> Dict[str, Any]:
         """Run complete trading analysis."""
         print("🤖 AI TRADING SYSTEM - PROFITABLE TRADES ANALYSIS")
@@ -435,35 +456,27 @@ class PolymarketTradingAI:
         print(f"Analysis Time: {datetime.now().isoformat()}")
         print("=" * 80)
         
-        # Get current active markets
+        # Get current active markets, reducing each page to market rows as it
+        # arrives so the raw event payloads are not all held at once
         print("\n📊 Fetching current active Polymarket data...")
-        markets_data = self.get_current_active_markets(max_events)
+        event_count = 0
+        active_markets = []
         
-        if not markets_data['success']:
+        try:
+            for page in self.client.iter_event_pages(max_events):
+                event_count += len(page)
+                active_markets.extend(self._active_market_rows(page))
+        except Exception as e:
             return {
                 'success': False,
-                'error': f"Failed to fetch markets: {markets_data.get('error', 'Unknown error')}",
+                'error': f"Failed to fetch markets: {e}",
                 'recommendations': []
             }
         
-        events = markets_data['data']
-        print(f"✅ Found {len(events)} current active events")
+        print(f"✅ Found {event_count} current active events")
         
         # Filter for markets with actual trading activity
         print("\n🔍 Filtering for markets with trading activity...")
-        active_markets = []
-        
-        for event in events:
-            markets = event.get('markets', [])
-            for market in markets:
-                # Only include markets with some liquidity and volume
-                liquidity = float(market.get('liquidity', 0))
-                volume = float(market.get('volume', 0))
-                
-                # Must have some trading activity
-                if liquidity > 0 or volume > 1000:
-                    active_markets.append((event, market))
-        
         print(f"✅ Found {len(active_markets)} markets with trading activity")
         
         # Analyze each active market
@@ -472,8 +485,8 @@ class PolymarketTradingAI:
         sell_count = 0
         hold_count = 0
         
-        for event, market in active_markets[:15]:  # Analyze first 15 active markets
-            analysis = self.analyze_market_for_trading(event, market)
+        for row in active_markets[:15]:  # Analyze first 15 active markets
+            analysis = self.analyze_market_for_trading(row)
             recommendations.append(analysis)
             
             if analysis['recommendation'] == 'BUY':
@@ -484,46 +497,31 @@ class PolymarketTradingAI:
                 hold_count += 1
         
         # Summary
-        print(f"\n📈 TRADING ANALYSIS COMPLETE")
-        print("=" * 80)
-        print(f"Total Markets Analyzed: {len(recommendations)}")
-        print(f"BUY Recommendations: {buy_count}")
-        print(f"SELL Recommendations: {sell_count}")
-        print(f"HOLD Recommendations: {hold_count}")
+        buf = io.StringIO()
+        print(f"\n📈 TRADING ANALYSIS COMPLETE", file=buf)
+        print("=" * 80, file=buf)
+        print(f"Total Markets Analyzed: {len(recommendations)}", file=buf)
+        print(f"BUY Recommendations: {buy_count}", file=buf)
+        print(f"SELL Recommendations: {sell_count}", file=buf)
+        print(f"HOLD Recommendations: {hold_count}", file=buf)
+        sys.stdout.write(buf.getvalue())
         
         # Show top recommendations with detailed chain of thought
-        buy_recommendations = [r for r in recommendations if r['recommendation'] == 'BUY']
-        sell_recommendations = [r for r in recommendations if r['recommendation'] == 'SELL']
-        
-        print(f"\n🎯 TOP BUY RECOMMENDATIONS:")
-        for rec in sorted(buy_recommendations, key=lambda x: x['confidence'], reverse=True)[:3]:
-            print(f"\n{'='*80}")
-            print(f"Event ID: {rec['event_id']}")
-            print(f"Market ID: {rec['market_id']}")
-            print(f"Question: {rec['question']}")
-            print(f"Recommendation: {rec['recommendation']} (Confidence: {rec['confidence']:.2f})")
-            print(f"Reasoning: {rec['reasoning']}")
-            print(f"\n🧠 AI CHAIN OF THOUGHT:")
-            for thought in rec['chain_of_thought']:
-                print(f"  {thought}")
-            print(f"\n📊 DATA SOURCES:")
-            for source in rec['data_sources']:
-                print(f"  - {source}")
-        
-        print(f"\n🎯 TOP SELL RECOMMENDATIONS:")
-        for rec in sorted(sell_recommendations, key=lambda x: x['confidence'], reverse=True)[:3]:
-            print(f"\n{'='*80}")
-            print(f"Event ID: {rec['event_id']}")
-            print(f"Market ID: {rec['market_id']}")
-            print(f"Question: {rec['question']}")
-            print(f"Recommendation: {rec['recommendation']} (Confidence: {rec['confidence']:.2f})")
-            print(f"Reasoning: {rec['reasoning']}")
-            print(f"\n🧠 AI CHAIN OF THOUGHT:")
-            for thought in rec['chain_of_thought']:
-                print(f"  {thought}")
-            print(f"\n📊 DATA SOURCES:")
-            for source in rec['data_sources']:
-                print(f"  - {source}")
+        by_confidence = operator.itemgetter('confidence')
+        top_buys = heapq.nlargest(3, (r for r in recommendations if r['recommendation'] == 'BUY'), key=by_confidence)
+        top_sells = heapq.nlargest(3, (r for r in recommendations if r['recommendation'] == 'SELL'), key=by_confidence)
+        
+        buf = io.StringIO()
+        print(f"\n🎯 TOP BUY RECOMMENDATIONS:", file=buf)
+        for rec in top_buys:
+            self._print_recommendation(rec, buf)
+        sys.stdout.write(buf.getvalue())
+        
+        buf = io.StringIO()
+        print(f"\n🎯 TOP SELL RECOMMENDATIONS:", file=buf)
+        for rec in top_sells:
+            self._print_recommendation(rec, buf)
+        sys.stdout.write(buf.getvalue())
         
         return {
             'success': True,
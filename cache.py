@@ -0,0 +1,65 @@
+"""
+File Cache for Polymarket API Responses
+
+Stores JSON payloads on disk with a timestamp so repeated runs can reuse
+slowly-changing event and market data instead of re-fetching it. Each entry
+is a single <md5>.json file under .cache/polymarket/ next to this module.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+
+class FileCache:
+    """JSON file cache keyed by endpoint and request parameters."""
+
+    DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'polymarket')
+
+    def __init__(self, cache_dir: str = DEFAULT_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """Build a stable cache key from an endpoint and its parameters."""
+        raw = json.dumps([endpoint, sorted(params.items())], default=str)
+        return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Return the cached payload for key, or None if missing or stale.
+
+        Args:
+            key: Cache key from make_key
+            ttl: Maximum age in seconds
+
+        Returns:
+            Cached payload or None
+        """
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('ts', 0) > ttl:
+            return None
+        return entry.get('payload')
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable payload under key (best effort)."""
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'ts': time.time(), 'payload': value}, f)
+            # Atomic swap so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # A failed cache write should never fail the analysis
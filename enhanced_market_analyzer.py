@@ -7,17 +7,21 @@ and integrates with our Phase 2 & 3 analysis system.
 """
 
 import requests
-import json
+import io
 import sys
 import os
-import time
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional
+
+from cache import FileCache
+from market_analyzer import MarketAnalyzer, MarketTable, ScoringConfig, SentimentSource
+import polymarket_api
+import scoring
 
 # Set UTF-8 encoding for Windows
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    # Reconfigure in place; a second wrapper around sys.stdout.buffer would
+    # close it when the first is discarded
+    sys.stdout.reconfigure(encoding='utf-8')
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -26,32 +30,61 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 class PolymarketRESTClient:
     """Direct REST API client for Polymarket."""
     
-    BASE_URL = "https://gamma-api.polymarket.com"
+    EVENTS_TTL = 300  # Seconds to reuse cached event listings
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+    def __init__(self, session: Optional[requests.Session] = None):
+        # Callers may pass a session to share; its headers, HTTPS connection
+        # pool and retry policy are configured here either way
+        self.session = polymarket_api.configure_session(session)
+        self.cache = FileCache()
     
-    def get_events(self, limit: int = 50, active: bool = True) -> Dict[str, Any]:
-        """Get events from Polymarket REST API."""
-        url = f"{self.BASE_URL}/events"
-        params = {"limit": limit}
+    def iter_event_pages(self, limit: int = 50, active: bool = True, cache: bool = True,
+                         page_size: int = polymarket_api.PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of events in order, reusing recent responses unless cache=False.
+        
+        Pages are fetched concurrently (see polymarket_api.iter_event_pages)
+        and the combined listing is cached once all have arrived. A cached
+        listing is yielded as a single page.
+        
+        Args:
+            limit: Maximum number of events to fetch
+            active: Only fetch active events (None for all)
+            cache: Reuse a recent cached listing if available
+            page_size: Events per request, at most PAGE_SIZE; smaller pages
+                let callers start on the first page sooner
+        
+        Raises:
+            requests.exceptions.RequestException: If a page cannot be fetched
+        """
+        params = {}
         
         if active is not None:
             params["active"] = str(active).lower()
         
+        cache_key = FileCache.make_key('events', dict(params, limit=limit))
+        if cache:
+            data = self.cache.get(cache_key, self.EVENTS_TTL)
+            if data is not None:
+                yield data
+                return
+        
+        data = []
+        for page in polymarket_api.iter_event_pages(self.session, params, limit, page_size):
+            data.extend(page)
+            yield page
+        
+        self.cache.set(cache_key, data)
+    
+    def get_events(self, limit: int = 50, active: bool = True, cache: bool = True) -> Dict[str, Any]:
+        """Get events from Polymarket REST API, reusing recent responses unless cache=False."""
         try:
-            response = self.session.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = [event for page in self.iter_event_pages(limit, active, cache) for event in page]
             
             return {
                 "success": True,
-                "data": data if isinstance(data, list) else [data],
-                "count": len(data) if isinstance(data, list) else 1,
+                "data": data,
+                "count": len(data),
                 "errors": []
             }
             
@@ -63,309 +96,123 @@ class PolymarketRESTClient:
                 "errors": [str(e)]
             }
     
-    def get_markets_from_events(self, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Extract markets from events."""
-        all_markets = []
+    def get_markets_from_events(self, events: List[Dict[str, Any]]) -> MarketTable:
+        """Extract markets from events into a MarketTable."""
+        table = MarketTable()
         
         for event in events:
+            end_date = event.get('endDate')
+            end_dt = polymarket_api.parse_end_date(end_date) if end_date else None
+            
             markets = event.get('markets', [])
             for market in markets:
-                # Add event context to market
+                # Add event context to a copy, leaving the (cached) event intact
+                market = dict(market)
                 market['event_id'] = event.get('id')
                 market['event_title'] = event.get('title')
                 market['event_category'] = event.get('category')
-                market['event_end_date'] = event.get('endDate')
-                all_markets.append(market)
+                market['event_end_date'] = end_date
+                table.append(market, end_dt)
         
-        return all_markets
+        return table
+
 
+# Scoring for markets drawn from the full /events listing
+ENHANCED_SCORING = ScoringConfig(
+    # Hype score tiers: a value strictly above a threshold earns that tier.
+    # Volume contributes 0-0.6 and liquidity 0-0.4.
+    hype_tiers=scoring.HypeTiers(
+        volume_thresholds=(1000, 5000, 10000, 20000, 50000),
+        volume_scores=(0.0, 0.1, 0.2, 0.3, 0.4, 0.6),
+        liquidity_thresholds=(100, 1000, 2000, 5000, 10000),
+        liquidity_scores=(0.0, 0.05, 0.1, 0.2, 0.3, 0.4),
+    ),
+    # Economic/crypto keywords
+    reddit=SentimentSource(
+        positive=frozenset({'growth', 'bullish', 'positive', 'up', 'rise', 'gain', 'recovery', 'boom'}),
+        negative=frozenset({'recession', 'crash', 'bearish', 'negative', 'down', 'fall', 'decline', 'bust'}),
+    ),
+    # News sentiment keywords
+    news=SentimentSource(
+        positive=frozenset({'win', 'success', 'positive', 'up', 'rise', 'gain', 'beat', 'victory'}),
+        negative=frozenset({'lose', 'fail', 'negative', 'down', 'fall', 'loss', 'defeat', 'crisis'}),
+    ),
+    # Web sentiment keywords
+    web=SentimentSource(
+        positive=frozenset({'optimistic', 'strong', 'increase', 'improve', 'better', 'win'}),
+        negative=frozenset({'pessimistic', 'weak', 'decrease', 'worse', 'decline', 'lose'}),
+    ),
+    buy_threshold=0.6,
+    sell_threshold=0.4,
+)
 
-class EnhancedMarketAnalyzer:
+
+class EnhancedMarketAnalyzer(MarketAnalyzer):
     """Enhanced market analyzer using direct REST API."""
     
+    TITLE = "Enhanced Market Analysis (REST API)"
+    RULE_WIDTH = 70
+    MARKETS_LABEL = "high-potential"
+    MARKETS_KEY = 'current_markets'
+    NO_MARKETS_ERROR = 'No active markets found'
+    STREAM_PAGE_SIZE = 25  # Events per page, so scoring overlaps later fetches
+    
     def __init__(self):
-        self.rest_client = PolymarketRESTClient()
+        # One session for all outbound calls so connections are reused
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.rest_client = PolymarketRESTClient(session=self.session)
+        super().__init__(self._fetch_markets, ENHANCED_SCORING)
     
-    def get_current_markets(self, max_events: int = 100) -> List[Dict[str, Any]]:
-        """
-        Phase 2: Get current active markets using REST API.
-        
-        Args:
-            max_events: Maximum events to fetch
-            
-        Returns:
-            List of current active markets
-        """
+    def _fetch_markets(self, max_events: int) -> Iterator[MarketTable]:
+        """Fetch active events page by page and extract each page's markets."""
         print("🔍 Phase 2: Fetching current markets via REST API...")
         
-        # Get events from REST API
-        events_result = self.rest_client.get_events(limit=max_events, active=True)
-        
-        if not events_result['success']:
-            print(f"❌ Error fetching events: {events_result['errors']}")
-            return []
-        
-        events = events_result['data']
-        print(f"📊 Found {len(events)} active events")
-        
-        # Extract markets from events
-        all_markets = self.rest_client.get_markets_from_events(events)
-        print(f"📈 Extracted {len(all_markets)} markets from events")
-        
-        # Filter for truly active markets
-        current_date = datetime.now()
-        active_markets = []
-        
-        for market in all_markets:
-            # Skip markets that have already ended
-            end_date = market.get('event_end_date', '')
-            if end_date:
-                try:
-                    end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                    if end_dt < current_date:
-                        continue  # Skip expired markets
-                except:
-                    pass
-            
-            # Only consider markets with actual liquidity
-            liquidity = float(market.get('liquidity', 0))
-            if liquidity <= 0:
-                continue  # Skip markets with no liquidity
-            
-            # Calculate hype score
-            score = self._calculate_hype_score(market)
-            
-            # Add time urgency bonus
-            if end_date:
-                try:
-                    end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                    days_left = (end_dt - current_date).days
-                    if days_left <= 7:  # Bonus for markets ending within a week
-                        score += 0.2
-                except:
-                    pass
-            
-            if score > 0.1:  # Low threshold to catch active markets
-                market['hype_score'] = min(score, 1.0)
-                active_markets.append(market)
-        
-        # Sort by hype score
-        active_markets.sort(key=lambda x: x['hype_score'], reverse=True)
-        
-        # Take top 5
-        top_markets = active_markets[:5]
-        
-        print(f"🎯 Selected {len(top_markets)} high-potential markets")
-        for i, market in enumerate(top_markets, 1):
-            print(f"  {i}. {market.get('question', '')[:50]}... (Score: {market['hype_score']:.2f})")
-            print(f"     Volume: ${float(market.get('volume', 0)):,.0f}")
-            print(f"     Liquidity: ${float(market.get('liquidity', 0)):,.0f}")
-            print(f"     End Date: {market.get('event_end_date', 'N/A')[:19]}")
-        
-        return top_markets
+        event_count = market_count = 0
+        # Get events from REST API, extracting markets as each page arrives.
+        # A failed page propagates to find_markets, which fails the whole run.
+        for events in self.rest_client.iter_event_pages(
+            limit=max_events, active=True, page_size=self.STREAM_PAGE_SIZE
+        ):
+            table = self.rest_client.get_markets_from_events(events)
+            event_count += len(events)
+            market_count += len(table)
+            yield table
+        
+        print(f"📊 Found {event_count} active events")
+        print(f"📈 Extracted {market_count} markets from events")
     
-    def _calculate_hype_score(self, market: Dict[str, Any]) -> float:
-        """Calculate hype score based on volume, liquidity, and other factors."""
-        volume = float(market.get('volume', 0))
-        liquidity = float(market.get('liquidity', 0))
-        
-        score = 0.0
-        
-        # Volume component (0-0.6)
-        if volume > 50000:
-            score += 0.6
-        elif volume > 20000:
-            score += 0.4
-        elif volume > 10000:
-            score += 0.3
-        elif volume > 5000:
-            score += 0.2
-        elif volume > 1000:
-            score += 0.1
-        
-        # Liquidity component (0-0.4)
-        if liquidity > 10000:
-            score += 0.4
-        elif liquidity > 5000:
-            score += 0.3
-        elif liquidity > 2000:
-            score += 0.2
-        elif liquidity > 1000:
-            score += 0.1
-        elif liquidity > 100:
-            score += 0.05
-        
-        return min(score, 1.0)
+    def find_markets(self, limit: int, **fetch_kwargs) -> List[Dict[str, Any]]:
+        """Find markets, treating a failure on any page as no markets at all."""
+        try:
+            return super().find_markets(limit, **fetch_kwargs)
+        except requests.exceptions.RequestException as e:
+            # Pages scored before the failure are discarded rather than
+            # ranked as if they were the whole listing
+            print(f"❌ Error fetching events: {[str(e)]}")
+            return []
     
-    def research_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
+    def get_current_markets(self, max_events: int = 100) -> List[Dict[str, Any]]:
         """
-        Phase 3: Research a market using free tools.
+        Phase 2: Get current active markets using REST API.
         
         Args:
-            market: Market to research
+            max_events: Maximum events to fetch
             
         Returns:
-            Research results
+            List of current active markets
         """
-        question = market.get('question', '')
-        print(f"\n🔬 Researching: {question[:50]}...")
-        
-        research_results = {
-            'market_id': market.get('id', ''),
-            'question': question,
-            'reddit_sentiment': self._get_reddit_sentiment(question),
-            'news_sentiment': self._get_news_sentiment(question),
-            'web_sentiment': self._get_web_sentiment(question),
-            'confidence_score': 0.0,
-            'recommendation': 'HOLD'
-        }
-        
-        # Calculate overall sentiment
-        sentiments = [
-            research_results['reddit_sentiment'],
-            research_results['news_sentiment'],
-            research_results['web_sentiment']
-        ]
-        
-        # Simple sentiment analysis
-        positive_count = sum(1 for s in sentiments if s > 0.6)
-        negative_count = sum(1 for s in sentiments if s < 0.4)
-        
-        if positive_count >= 2:
-            research_results['confidence_score'] = 0.7
-            research_results['recommendation'] = 'BUY'
-        elif negative_count >= 2:
-            research_results['confidence_score'] = 0.3
-            research_results['recommendation'] = 'SELL'
-        else:
-            research_results['confidence_score'] = 0.5
-            research_results['recommendation'] = 'HOLD'
-        
-        print(f"  Reddit: {research_results['reddit_sentiment']:.2f}")
-        print(f"  News: {research_results['news_sentiment']:.2f}")
-        print(f"  Web: {research_results['web_sentiment']:.2f}")
-        print(f"  Recommendation: {research_results['recommendation']}")
-        
-        return research_results
+        return self.find_markets(max_events)
     
-    def _get_reddit_sentiment(self, query: str) -> float:
-        """Get sentiment from Reddit using keyword analysis."""
-        try:
-            query_lower = query.lower()
-            
-            # Economic/crypto keywords
-            positive_econ = ['growth', 'bullish', 'positive', 'up', 'rise', 'gain', 'recovery', 'boom']
-            negative_econ = ['recession', 'crash', 'bearish', 'negative', 'down', 'fall', 'decline', 'bust']
-            
-            pos_count = sum(1 for word in positive_econ if word in query_lower)
-            neg_count = sum(1 for word in negative_econ if word in query_lower)
-            
-            if pos_count + neg_count > 0:
-                return pos_count / (pos_count + neg_count)
-            else:
-                return 0.5  # Neutral
-                
-        except Exception as e:
-            print(f"    Reddit sentiment error: {e}")
-            return 0.5
-    
-    def _get_news_sentiment(self, query: str) -> float:
-        """Get sentiment from news using keyword analysis."""
-        try:
-            query_lower = query.lower()
-            
-            # News sentiment keywords
-            positive_words = ['win', 'success', 'positive', 'up', 'rise', 'gain', 'beat', 'victory']
-            negative_words = ['lose', 'fail', 'negative', 'down', 'fall', 'loss', 'defeat', 'crisis']
-            
-            pos_count = sum(1 for word in positive_words if word in query_lower)
-            neg_count = sum(1 for word in negative_words if word in query_lower)
-            
-            if pos_count + neg_count > 0:
-                return pos_count / (pos_count + neg_count)
-            else:
-                return 0.5  # Neutral
-                
-        except Exception as e:
-            print(f"    News sentiment error: {e}")
-            return 0.5
-    
-    def _get_web_sentiment(self, query: str) -> float:
-        """Get sentiment from web search using keyword analysis."""
-        try:
-            query_lower = query.lower()
-            
-            # Web sentiment keywords
-            positive_words = ['optimistic', 'strong', 'increase', 'improve', 'better', 'win']
-            negative_words = ['pessimistic', 'weak', 'decrease', 'worse', 'decline', 'lose']
-            
-            pos_count = sum(1 for word in positive_words if word in query_lower)
-            neg_count = sum(1 for word in negative_words if word in query_lower)
-            
-            if pos_count + neg_count > 0:
-                return pos_count / (pos_count + neg_count)
-            else:
-                return 0.5  # Neutral
-                
-        except Exception as e:
-            print(f"    Web sentiment error: {e}")
-            return 0.5
+    def _print_selected_market(self, rank: int, market: Dict[str, Any], file) -> None:
+        """Print one selected market with its trading details to file."""
+        super()._print_selected_market(rank, market, file)
+        print(f"     Volume: ${market['_volume']:,.0f}", file=file)
+        print(f"     Liquidity: ${market['_liquidity']:,.0f}", file=file)
+        print(f"     End Date: {market.get('event_end_date', 'N/A')[:19]}", file=file)
     
     def run_complete_analysis(self, max_events: int = 100) -> Dict[str, Any]:
         """Run complete Phase 2 + Phase 3 analysis using REST API."""
-        print("🚀 Starting Enhanced Market Analysis (REST API)")
-        print("=" * 70)
-        
-        # Phase 2: Get current markets
-        current_markets = self.get_current_markets(max_events)
-        
-        if not current_markets:
-            return {
-                'success': False,
-                'error': 'No active markets found',
-                'results': []
-            }
-        
-        # Phase 3: Research each market
-        print(f"\n🔬 Phase 3: Researching {len(current_markets)} markets...")
-        research_results = []
-        
-        for market in current_markets:
-            result = self.research_market(market)
-            research_results.append(result)
-            time.sleep(1)  # Rate limiting between markets
-        
-        # Summary
-        print(f"\n📊 ANALYSIS COMPLETE")
-        print("=" * 70)
-        
-        buy_recommendations = [r for r in research_results if r['recommendation'] == 'BUY']
-        sell_recommendations = [r for r in research_results if r['recommendation'] == 'SELL']
-        
-        print(f"Total Markets Analyzed: {len(research_results)}")
-        print(f"BUY Recommendations: {len(buy_recommendations)}")
-        print(f"SELL Recommendations: {len(sell_recommendations)}")
-        
-        print(f"\n🎯 TOP RECOMMENDATIONS:")
-        for result in research_results:
-            if result['recommendation'] in ['BUY', 'SELL']:
-                print(f"  {result['recommendation']}: {result['question'][:50]}...")
-                print(f"    Confidence: {result['confidence_score']:.2f}")
-        
-        return {
-            'success': True,
-            'current_markets': current_markets,
-            'research_results': research_results,
-            'summary': {
-                'total_analyzed': len(research_results),
-                'buy_recommendations': len(buy_recommendations),
-                'sell_recommendations': len(sell_recommendations)
-            }
-        }
+        return super().run_complete_analysis(max_events)
 
 
 def main():
@@ -374,19 +221,21 @@ def main():
     result = analyzer.run_complete_analysis(max_events=50)
     
     if result['success']:
-        print(f"\n✅ Enhanced analysis complete!")
-        print(f"Found {result['summary']['buy_recommendations']} BUY opportunities")
-        print(f"Found {result['summary']['sell_recommendations']} SELL opportunities")
+        buf = io.StringIO()
+        print(f"\n✅ Enhanced analysis complete!", file=buf)
+        print(f"Found {result['summary']['buy_recommendations']} BUY opportunities", file=buf)
+        print(f"Found {result['summary']['sell_recommendations']} SELL opportunities", file=buf)
         
         # Show market details
-        print(f"\n📈 MARKET DETAILS:")
+        print(f"\n📈 MARKET DETAILS:", file=buf)
         for market in result['current_markets']:
-            print(f"\nMarket: {market.get('question', '')[:60]}...")
-            print(f"  Event: {market.get('event_title', '')[:40]}...")
-            print(f"  Volume: ${float(market.get('volume', 0)):,.0f}")
-            print(f"  Liquidity: ${float(market.get('liquidity', 0)):,.0f}")
-            print(f"  End Date: {market.get('event_end_date', 'N/A')[:19]}")
-            print(f"  Hype Score: {market.get('hype_score', 0):.2f}")
+            print(f"\nMarket: {market.get('question', '')[:60]}...", file=buf)
+            print(f"  Event: {market.get('event_title', '')[:40]}...", file=buf)
+            print(f"  Volume: ${market['_volume']:,.0f}", file=buf)
+            print(f"  Liquidity: ${market['_liquidity']:,.0f}", file=buf)
+            print(f"  End Date: {market.get('event_end_date', 'N/A')[:19]}", file=buf)
+            print(f"  Hype Score: {market.get('hype_score', 0):.2f}", file=buf)
+        sys.stdout.write(buf.getvalue())
     else:
         print(f"\n❌ Analysis failed: {result['error']}")
 
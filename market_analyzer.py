@@ -0,0 +1,297 @@
+"""
+Shared Phase 2 & 3 Market Analysis
+
+Filtering, hype scoring, top-market selection and keyword research used by
+both the enhanced (REST API) and simple (v2 API) analyzers. The analyzers
+differ only in where markets come from and in their ScoringConfig.
+"""
+
+import heapq
+import io
+import operator
+import re
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from polymarket_api import parse_end_date
+import scoring
+
+
+# Word tokens of a question; keywords are single words matched whole
+_TOKEN_RE = re.compile(r'\w+')
+
+
+@dataclass
+class SentimentSource:
+    """
+    Positive/negative keywords for one sentiment source.
+
+    Questions are tokenized once and each source counts its distinct
+    keyword hits with set intersections.
+    """
+    positive: frozenset
+    negative: frozenset
+
+    def score(self, tokens: AbstractSet[str]) -> float:
+        """Share of the distinct keyword hits that are positive (0.5 if none)."""
+        pos_count = len(self.positive & tokens)
+        neg_count = len(self.negative & tokens)
+        if pos_count + neg_count == 0:
+            return 0.5  # Neutral
+        return pos_count / (pos_count + neg_count)
+
+
+@dataclass
+class ScoringConfig:
+    """Thresholds and keywords that distinguish one analyzer from another."""
+    hype_tiers: scoring.HypeTiers
+    reddit: SentimentSource
+    news: SentimentSource
+    web: SentimentSource
+    buy_threshold: float  # Sentiments above this count towards BUY
+    sell_threshold: float  # Sentiments below this count towards SELL
+    min_hype_score: float = 0.1  # Low threshold to catch active markets
+    top_n: int = 5
+
+
+@dataclass
+class MarketTable:
+    """
+    Column-oriented view of extracted markets.
+
+    The filter and scoring pass reads only the numeric columns; the raw market
+    dicts are kept alongside, in the same order, for the markets that get
+    selected and displayed.
+    """
+    markets: List[Dict[str, Any]] = field(default_factory=list)
+    volumes: array = field(default_factory=lambda: array('d'))
+    liquidities: array = field(default_factory=lambda: array('d'))
+    end_dates: List[Optional[datetime]] = field(default_factory=list)
+
+    @classmethod
+    def from_markets(cls, markets: Iterable[Dict[str, Any]], end_date_key: str) -> 'MarketTable':
+        """Build a table from market dicts carrying their own end dates."""
+        table = cls()
+        for market in markets:
+            end_date = market.get(end_date_key)
+            table.append(market, parse_end_date(end_date) if end_date else None)
+        return table
+
+    def append(self, market: Dict[str, Any], end_dt: Optional[datetime]) -> None:
+        """
+        Add a market, coercing its numeric fields once.
+
+        The API sends volume and liquidity as strings (or null); the floats
+        are also stored on the market as _volume and _liquidity so later
+        display code does not re-parse them.
+        """
+        market['_volume'] = volume = float(market.get('volume') or 0)
+        market['_liquidity'] = liquidity = float(market.get('liquidity') or 0)
+        self.markets.append(market)
+        self.volumes.append(volume)
+        self.liquidities.append(liquidity)
+        self.end_dates.append(end_dt)
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+
+class MarketAnalyzer:
+    """
+    Phase 2 + Phase 3 market analyzer.
+
+    fetch_fn loads markets for Phase 2 and returns them as an iterable of
+    MarketTable pages, or None if they could not be fetched. Pages are scored
+    as they are produced, so a lazy fetch_fn overlaps scoring with fetching.
+    It is called with the market limit and any extra keyword arguments passed
+    to find_markets, and reports its own progress.
+    """
+
+    TITLE = "Market Analysis"
+    RULE_WIDTH = 60
+    MARKETS_LABEL = "hype"  # Used in "Selected N <label> markets"
+    MARKETS_KEY = 'hype_markets'  # Key of the selected markets in the results
+    NO_MARKETS_ERROR = 'No hype markets found'
+    RESEARCH_WORKERS = 8  # Markets researched concurrently in Phase 3
+
+    def __init__(self, fetch_fn: Callable[..., Optional[Iterable[MarketTable]]], config: ScoringConfig):
+        self.fetch_fn = fetch_fn
+        self.config = config
+
+    def find_markets(self, limit: int, **fetch_kwargs) -> List[Dict[str, Any]]:
+        """
+        Phase 2: Find the highest-hype active markets.
+
+        Args:
+            limit: Maximum markets (or events) to fetch
+            **fetch_kwargs: Passed through to fetch_fn
+
+        Returns:
+            Top markets, each annotated with its hype_score
+        """
+        tables = self.fetch_fn(limit, **fetch_kwargs)
+        if tables is None:
+            return []
+
+        # Keep a running top-N heap while the pages are scored
+        current_date = datetime.now(timezone.utc)
+        top_markets = heapq.nlargest(
+            self.config.top_n,
+            self._active_markets(tables, current_date),
+            key=operator.itemgetter('hype_score')
+        )
+
+        buf = io.StringIO()
+        print(f"🎯 Selected {len(top_markets)} {self.MARKETS_LABEL} markets", file=buf)
+        for i, market in enumerate(top_markets, 1):
+            self._print_selected_market(i, market, buf)
+        sys.stdout.write(buf.getvalue())
+
+        return top_markets
+
+    def _active_markets(self, tables: Iterable[MarketTable], current_date: datetime) -> Iterator[Dict[str, Any]]:
+        """Yield the active markets of each table, annotated with their hype_score."""
+        for table in tables:
+            # Filter for truly active markets, scanning the numeric columns
+            columns = zip(table.volumes, table.liquidities, table.end_dates)
+            for i, (volume, liquidity, end_dt) in enumerate(columns):
+                # Skip markets that have already ended
+                if end_dt is not None and end_dt < current_date:
+                    continue  # Skip expired markets
+
+                # Only consider markets with actual liquidity
+                if liquidity <= 0:
+                    continue  # Skip markets with no liquidity
+
+                # Calculate hype score, including the time urgency bonus
+                days_left = (end_dt - current_date).days if end_dt is not None else None
+                score = scoring.hype_score(volume, liquidity, days_left, self.config.hype_tiers)
+
+                if score > self.config.min_hype_score:
+                    market = table.markets[i]
+                    market['hype_score'] = score
+                    yield market
+
+    def _print_selected_market(self, rank: int, market: Dict[str, Any], file) -> None:
+        """Print one selected market to file."""
+        print(f"  {rank}. {market.get('question', '')[:50]}... (Score: {market['hype_score']:.2f})", file=file)
+
+    def research_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Phase 3: Research a market using free tools.
+
+        Args:
+            market: Market to research
+
+        Returns:
+            Research results
+        """
+        question = market.get('question', '')
+
+        reddit_sentiment, news_sentiment, web_sentiment = self._score_query(question)
+
+        research_results = {
+            'market_id': market.get('id', ''),
+            'question': question,
+            'reddit_sentiment': reddit_sentiment,
+            'news_sentiment': news_sentiment,
+            'web_sentiment': web_sentiment,
+            'confidence_score': 0.0,
+            'recommendation': 'HOLD'
+        }
+
+        # Simple sentiment analysis
+        sentiments = (reddit_sentiment, news_sentiment, web_sentiment)
+        positive_count = sum(1 for s in sentiments if s > self.config.buy_threshold)
+        negative_count = sum(1 for s in sentiments if s < self.config.sell_threshold)
+
+        if positive_count >= 2:
+            research_results['confidence_score'] = 0.7
+            research_results['recommendation'] = 'BUY'
+        elif negative_count >= 2:
+            research_results['confidence_score'] = 0.3
+            research_results['recommendation'] = 'SELL'
+        else:
+            research_results['confidence_score'] = 0.5
+            research_results['recommendation'] = 'HOLD'
+
+        return research_results
+
+    def _print_research(self, research_results: Dict[str, Any], file) -> None:
+        """Print the research summary for one market to file."""
+        print(f"\n🔬 Researching: {research_results['question'][:50]}...", file=file)
+        print(f"  Reddit: {research_results['reddit_sentiment']:.2f}", file=file)
+        print(f"  News: {research_results['news_sentiment']:.2f}", file=file)
+        print(f"  Web: {research_results['web_sentiment']:.2f}", file=file)
+        print(f"  Recommendation: {research_results['recommendation']}", file=file)
+
+    def _score_query(self, query: str) -> Tuple[float, float, float]:
+        """Return the (reddit, news, web) keyword sentiments for a query."""
+        tokens = frozenset(_TOKEN_RE.findall(query.lower()))
+        return (
+            self.config.reddit.score(tokens),
+            self.config.news.score(tokens),
+            self.config.web.score(tokens),
+        )
+
+    def run_complete_analysis(self, limit: int, **fetch_kwargs) -> Dict[str, Any]:
+        """Run complete Phase 2 + Phase 3 analysis."""
+        print(f"🚀 Starting {self.TITLE}")
+        print("=" * self.RULE_WIDTH)
+
+        # Phase 2: Find markets
+        markets = self.find_markets(limit, **fetch_kwargs)
+
+        if not markets:
+            return {
+                'success': False,
+                'error': self.NO_MARKETS_ERROR,
+                'results': []
+            }
+
+        # Phase 3: Research each market
+        print(f"\n🔬 Phase 3: Researching {len(markets)} markets...")
+
+        # Research is CPU-only keyword scoring today, so markets are researched
+        # concurrently and reported in their original order
+        with ThreadPoolExecutor(max_workers=self.RESEARCH_WORKERS) as pool:
+            research_results = list(pool.map(self.research_market, markets))
+
+        buf = io.StringIO()
+        for result in research_results:
+            self._print_research(result, buf)
+        sys.stdout.write(buf.getvalue())
+
+        # Summary
+        buf = io.StringIO()
+        print(f"\n📊 ANALYSIS COMPLETE", file=buf)
+        print("=" * self.RULE_WIDTH, file=buf)
+
+        buy_recommendations = [r for r in research_results if r['recommendation'] == 'BUY']
+        sell_recommendations = [r for r in research_results if r['recommendation'] == 'SELL']
+
+        print(f"Total Markets Analyzed: {len(research_results)}", file=buf)
+        print(f"BUY Recommendations: {len(buy_recommendations)}", file=buf)
+        print(f"SELL Recommendations: {len(sell_recommendations)}", file=buf)
+
+        print(f"\n🎯 TOP RECOMMENDATIONS:", file=buf)
+        for result in research_results:
+            if result['recommendation'] in ['BUY', 'SELL']:
+                print(f"  {result['recommendation']}: {result['question'][:50]}...", file=buf)
+                print(f"    Confidence: {result['confidence_score']:.2f}", file=buf)
+        sys.stdout.write(buf.getvalue())
+
+        return {
+            'success': True,
+            self.MARKETS_KEY: markets,
+            'research_results': research_results,
+            'summary': {
+                'total_analyzed': len(research_results),
+                'buy_recommendations': len(buy_recommendations),
+                'sell_recommendations': len(sell_recommendations)
+            }
+        }
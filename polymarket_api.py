@@ -0,0 +1,120 @@
+"""
+Shared Polymarket API Helpers
+
+HTTP plumbing used by both the trading system and the enhanced analyzer:
+session setup (headers, connection pool, retries), JSON parsing and
+concurrent pagination of the /events endpoint. Keeping it in one place
+keeps the two clients' timeouts and retry policy identical.
+
+Also home to parse_end_date, which every analyzer uses to read the API's
+end-date fields.
+"""
+
+import functools
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    json_loads = json.loads
+
+BASE_URL = "https://gamma-api.polymarket.com"
+PAGE_SIZE = 100  # Maximum events returned per /events request
+MAX_WORKERS = 10  # Concurrent HTTP requests
+POOL_SIZE = 20  # Keep-alive connections per host
+RETRIES = 3  # Attempts after a connection error or transient status
+TIMEOUT = (3.05, 15)  # (connect, read) seconds
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Cheap shape check so malformed end dates are rejected without an exception
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+@functools.lru_cache(maxsize=2048)
+def parse_end_date(end_date: str) -> Optional[datetime]:
+    """Parse an ISO-8601 end date to an aware UTC datetime, or None if invalid."""
+    if not _ISO_DATE_RE.match(end_date):
+        return None
+    try:
+        end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+    except ValueError:
+        # Well-formed but out of range, e.g. month 13
+        return None
+    if end_dt.tzinfo is None:
+        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    return end_dt
+
+
+def configure_session(session: Optional[requests.Session] = None) -> requests.Session:
+    """
+    Prepare a session for Polymarket requests, creating one if needed.
+
+    Sets the User-Agent and mounts an HTTPS adapter that pools keep-alive
+    connections and retries rate limits and transient server errors with
+    exponential backoff.
+    """
+    if session is None:
+        session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    retry = Retry(total=RETRIES, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+
+def fetch_events_page(session: requests.Session, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Fetch a single page of events.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails or the
+            body is not valid JSON
+    """
+    response = session.get(f"{BASE_URL}/events", params=params, timeout=TIMEOUT)
+    response.raise_for_status()
+
+    try:
+        data = json_loads(response.content)
+    except ValueError as e:
+        # Report a malformed body like any other failed request, as
+        # response.json() did, so callers need only one except clause
+        raise requests.exceptions.RequestException(f"Invalid JSON from /events: {e}", response=response) from e
+    return data if isinstance(data, list) else [data]
+
+
+def iter_event_pages(session: requests.Session, params: Dict[str, Any], limit: int,
+                     page_size: int = PAGE_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield pages of events matching params, in order.
+
+    Pages are fetched concurrently and each is yielded as soon as it and the
+    pages before it have arrived, so callers can process early pages while
+    later ones are still in flight.
+
+    Args:
+        session: Session from configure_session
+        params: /events query parameters, without limit/offset
+        limit: Maximum number of events to fetch
+        page_size: Events per request, at most PAGE_SIZE
+
+    Raises:
+        requests.exceptions.RequestException: If a page cannot be fetched
+    """
+    page_size = max(1, min(page_size, PAGE_SIZE))
+    pages = [
+        dict(params, limit=min(page_size, limit - offset), offset=offset)
+        for offset in range(0, limit, page_size)
+    ]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(pages)))) as pool:
+        yield from pool.map(functools.partial(fetch_events_page, session), pages)
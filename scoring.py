@@ -0,0 +1,92 @@
+"""
+Numeric Scoring Kernels
+
+Pure functions of plain numbers used by the trading analyzers. They hold
+no state and build no strings, so they can be called per market or reused
+for batch scoring without touching any presentation code.
+"""
+
+from bisect import bisect_left
+from collections import namedtuple
+from typing import Optional, Sequence
+
+# Stepped score tiers. bisect_left over the ascending thresholds picks the
+# tier index: strictly above a threshold moves up one tier. Tier scores are
+# integer hundredths so the stepped sums are exact; each component score is
+# converted to a float only once, in quantized_score.
+BASE_SCORE = 50
+
+HIST_VOLUME_THRESHOLDS = (10000, 50000, 100000)
+HIST_VOLUME_SCORES = (-10, 0, 10, 20)
+
+HIST_LIQUIDITY_THRESHOLDS = (100, 1000, 10000)
+HIST_LIQUIDITY_SCORES = (-20, 0, 10, 20)
+
+HIST_CATEGORY_BONUS = 10
+
+# Time risk uses inclusive bounds (ends within N days)
+RISK_DAYS_THRESHOLDS = (1, 3, 7, 30)
+RISK_DAYS_SCORES = (-30, -20, -10, 10, 20)
+
+RISK_LIQUIDITY_THRESHOLDS = (1000, 5000)
+RISK_LIQUIDITY_SCORES = (-20, 0, 10)
+
+# Hype scoring. Each analyzer ranks a different market universe, so the
+# volume/liquidity tier tables are supplied per caller as HypeTiers; scores
+# are fractions in [0, 1] rather than hundredths.
+HypeTiers = namedtuple(
+    'HypeTiers', 'volume_thresholds volume_scores liquidity_thresholds liquidity_scores'
+)
+
+HYPE_URGENCY_DAYS = 7  # Bonus for markets ending within a week
+HYPE_URGENCY_BONUS = 0.2
+
+SENTIMENT_WEIGHT = 0.4
+HISTORICAL_WEIGHT = 0.3
+RISK_WEIGHT = 0.3
+
+
+def tier(thresholds: Sequence[float], value: float) -> int:
+    """Return the index of the tier that value falls into."""
+    return bisect_left(thresholds, value)
+
+
+def quantized_score(hundredths: int) -> float:
+    """Clamp a score in hundredths to [0, 100] and return it in the [0, 1] range."""
+    return min(max(hundredths, 0), 100) / 100
+
+
+def historical_score(volume: float, liquidity: float, volatile_category: bool) -> float:
+    """Score volume, liquidity and category activity."""
+    score = BASE_SCORE
+    score += HIST_VOLUME_SCORES[tier(HIST_VOLUME_THRESHOLDS, volume)]
+    score += HIST_LIQUIDITY_SCORES[tier(HIST_LIQUIDITY_THRESHOLDS, liquidity)]
+    if volatile_category:
+        score += HIST_CATEGORY_BONUS
+    return quantized_score(score)
+
+
+def risk_score(liquidity: float, days_until_end: int) -> float:
+    """Score time-to-resolution and liquidity risk (higher is safer)."""
+    score = BASE_SCORE
+    score += RISK_DAYS_SCORES[tier(RISK_DAYS_THRESHOLDS, days_until_end)]
+    score += RISK_LIQUIDITY_SCORES[tier(RISK_LIQUIDITY_THRESHOLDS, liquidity)]
+    return quantized_score(score)
+
+
+def overall_score(sentiment: float, historical: float, risk: float) -> float:
+    """Combine the component scores using the strategy weights."""
+    return (
+        sentiment * SENTIMENT_WEIGHT +
+        historical * HISTORICAL_WEIGHT +
+        risk * RISK_WEIGHT
+    )
+
+
+def hype_score(volume: float, liquidity: float, days_left: Optional[int], tiers: HypeTiers) -> float:
+    """Score market activity plus time urgency, capped at 1.0 (days_left None if no end date)."""
+    score = tiers.volume_scores[tier(tiers.volume_thresholds, volume)]
+    score += tiers.liquidity_scores[tier(tiers.liquidity_thresholds, liquidity)]
+    if days_left is not None and days_left <= HYPE_URGENCY_DAYS:
+        score += HYPE_URGENCY_BONUS
+    return min(score, 1.0)